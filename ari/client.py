@@ -5,10 +5,22 @@
 """ARI client library.
 """
 
-import json
+import collections
 import logging
+import select
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 import websocket # Using websocket-client
+
+# Prefer orjson (C parser, takes bytes or str) for the per-event JSON decode,
+# falling back to ujson and then the stdlib.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
 from bravado_core.spec import Spec
 from bravado_core.client import SwaggerClient
 from bravado_core.http_client import RequestsClient # Default, or use the one passed in
@@ -17,15 +29,87 @@ from ari.model import *
 
 log = logging.getLogger(__name__)
 
+# Sentinel (registrations, snapshot) pair for event types with no listeners.
+_EMPTY = ({}, ())
+
+# Frame opcodes, hoisted so the receive loop reads module globals.
+_OPCODE_TEXT = websocket.ABNF.OPCODE_TEXT
+_OPCODE_BINARY = websocket.ABNF.OPCODE_BINARY
+_OPCODE_CLOSE = websocket.ABNF.OPCODE_CLOSE
+
+
+def _new_listener_entry():
+    """Default (registrations, snapshot) pair for event_listeners."""
+    return {}, ()
+
+
+class _EventModelsView(object):
+    """Read-only, lazy view of the event model specs.
+
+    Delegates lookups to the bravado_core definitions map and extracts each
+    model's spec_dict on demand, instead of copying every model spec into a
+    separate dict at startup. Keys are event type strings and values are
+    model definitions (dicts).
+
+    :param definitions: bravado_core definitions map (name -> model).
+    """
+
+    def __init__(self, definitions):
+        self._defs = definitions or {}
+
+    @staticmethod
+    def _spec_dict(model):
+        # bravado_core models carry their raw spec as spec_dict; tolerate
+        # plain dicts so prebuilt specs keep working.
+        return getattr(model, 'spec_dict', model)
+
+    def __getitem__(self, name):
+        return self._spec_dict(self._defs[name])
+
+    def __contains__(self, name):
+        return name in self._defs
+
+    def __iter__(self):
+        return iter(self._defs)
+
+    def __len__(self):
+        return len(self._defs)
+
+    def keys(self):
+        return self._defs.keys()
+
+    def get(self, name, default=None):
+        model = self._defs.get(name)
+        if model is None:
+            return default
+        return self._spec_dict(model)
+
+    def values(self):
+        for model in self._defs.values():
+            yield self._spec_dict(model)
+
+    def items(self):
+        for name, model in self._defs.items():
+            yield name, self._spec_dict(model)
+
+# Model ids whose event fields are precomputed at spec-load time.
+_EVENT_MODEL_IDS = ('Channel', 'Bridge', 'Playback', 'LiveRecording',
+                    'StoredRecording', 'Endpoint', 'DeviceState', 'Sound')
+
 
 class Client(object):
     """ARI Client object.
 
     :param base_url: Base URL for accessing Asterisk.
     :param http_client: HTTP client interface.
+    :param spec: Optional pre-parsed bravado_core Spec. When given, the
+                 api-docs fetch and swagger parse are skipped and the spec
+                 is shared; parsed specs are immutable, so callers building
+                 many clients against one Asterisk (or test suites) can
+                 parse once and reuse.
     """
 
-    def __init__(self, base_url, http_client_input): # Renamed http_client to http_client_input to avoid conflict
+    def __init__(self, base_url, http_client_input, spec=None): # Renamed http_client to http_client_input to avoid conflict
         # Ensure http_client_input is a bravado-core compatible HttpClient
         # If it's a requests.Session, bravado-core can use it directly.
         # If not, it might need wrapping or adjustment.
@@ -40,13 +124,25 @@ class Client(object):
         # We'll assume the passed http_client_input is a requests.Session or similar that bravado-core can handle.
 
         self.raw_http_client = http_client_input # Store the original http_client if needed
+        self.base_url = base_url
+
+        # Precompute the WebSocket URL template once; run() only needs to
+        # substitute the app list. ARI events live at
+        # <base>/events/eventWebsocket relative to the ARI application root.
+        parsed_b_url = urlparse(base_url)
+        ws_scheme = 'wss' if parsed_b_url.scheme == 'https' else 'ws'
+        ws_url_path = parsed_b_url.path.rstrip('/') + '/events/eventWebsocket'
+        self._ws_url_template = \
+            f"{ws_scheme}://{parsed_b_url.netloc}{ws_url_path}?app={{apps}}"
 
         api_docs_url = urljoin(base_url, "ari/api-docs/resources.json")
 
         # TODO: Determine if http_client_input needs to be wrapped in RequestsClient
         # or if bravado can consume it directly. For now, let bravado handle it.
         # If http_client_input is a requests.Session, bravado-core handles it.
-        self.swagger_spec = Spec.from_url(api_docs_url, http_client=http_client_input)
+        if spec is None:
+            spec = Spec.from_url(api_docs_url, http_client=http_client_input)
+        self.swagger_spec = spec
         self.swagger_client = SwaggerClient(self.swagger_spec, http_client=http_client_input)
 
         self.repositories = {
@@ -54,31 +150,31 @@ class Client(object):
             for (name, resource) in self.swagger_spec.resources.items()
         }
 
-        # Extract event models from the spec definitions
-        # This is an approximation; actual event model identification might be more complex
-        # depending on how ARI defines them in its OpenAPI spec.
-        self.event_models = {
-            name: model_spec.spec_dict
-            for name, model_spec in self.swagger_spec.definitions.items()
-            # Heuristic: ARI event models often end with 'Event' or are referenced by event resources.
-            # A more robust method would be to inspect the 'events' resource if defined,
-            # or look for a specific marker/tag in the model definitions.
-            # For now, this is a broad filter and might need refinement.
-            # The original code looked for models under an 'events' resource declaration.
-        }
-        # Attempt to refine event_models based on 'events' resource if it exists
-        if 'events' in self.swagger_spec.resources:
-            # This part is still speculative as bravado-core's resource object structure
-            # for accessing associated models needs to be confirmed.
-            # Assuming models specific to an 'events' resource might be found via its operations or definitions.
-            # For now, the above general collection from spec.definitions will be used.
-            # The key is that self.event_models should be a dict where keys are event type strings
-            # and values are model definitions (dicts).
-            pass
-
-
-        self.websockets = set()
-        self.event_listeners = {}
+        # Expose event models lazily from the spec definitions; most
+        # applications only ever register for a handful of event types, so
+        # there is no point materializing every model spec up front.
+        self.event_models = _EventModelsView(self.swagger_spec.definitions)
+
+        # Precompute, per (event type, model id), which event fields carry
+        # objects of that model; on_object_event then only does a dict lookup.
+        self._obj_fields_cache = {}
+        for event_type, model_spec in self.event_models.items():
+            for model_id in _EVENT_MODEL_IDS:
+                obj_fields = self._build_obj_fields(model_spec, model_id)
+                if obj_fields:
+                    self._obj_fields_cache[(event_type, model_id)] = \
+                        obj_fields
+
+        # A plain list: the typical count is one to a few, and identity-based
+        # append/remove avoids hashing the WebSocket objects (and any
+        # subclass overriding __hash__/__eq__).
+        self.websockets = []
+        self.event_listeners = collections.defaultdict(_new_listener_entry)
+        # Maps of object id -> listener entries, keyed by (event type,
+        # model class) and maintained by BaseObject.on_event; one shared
+        # dispatcher per key consults these instead of a filter closure
+        # per object.
+        self._object_listeners = {}
         self.exception_handler = \
             lambda ex: log.exception("Event listener threw exception")
 
@@ -99,12 +195,12 @@ class Client(object):
         This method will close any currently open WebSockets, and close the
         underlying Swaggerclient.
         """
-        for ws in list(self.websockets): # Iterate over a copy for safe removal
-            try:
-                ws.send_close() # websocket-client uses send_close() then close()
-                ws.close()
-            except Exception as e:
-                log.warning(f"Error closing WebSocket: {e}")
+        websockets = list(self.websockets) # Copy for safe removal
+        if websockets:
+            # Close in parallel; each close handshake costs a network RTT,
+            # so N WebSockets close in ~1 RTT instead of N.
+            with ThreadPoolExecutor(max_workers=len(websockets)) as executor:
+                list(executor.map(self._close_websocket, websockets))
 
         # Close the http_client if it has a close method (e.g., if it's a requests.Session)
         # bravado-core's SwaggerClient holds the http_client it uses.
@@ -120,6 +216,37 @@ class Client(object):
                 log.warning(f"Error closing raw_http_client: {e}")
 
 
+    @staticmethod
+    def _build_obj_fields(event_model_spec, model_id):
+        """Extract the names of the fields in a model spec with a given type.
+
+        The structure of event_model_spec (from
+        bravado_core.spec.Spec.definitions[...].spec_dict) should be similar
+        to the old event_model structure.
+
+        :param event_model_spec: Model spec dict to walk.
+        :param model_id: String id for the model to look for.
+        :return: Tuple of field names.
+        """
+        # Build the $ref suffix once instead of an f-string per property.
+        suffix = '/' + model_id
+        return tuple(
+            k for (k, v) in event_model_spec.get('properties', {}).items()
+            if v.get('type') == model_id or
+            (v.get('$ref') or '').endswith(suffix))
+
+    @staticmethod
+    def _close_websocket(ws):
+        """Close a single WebSocket, logging (not raising) failures.
+
+        :param ws: WebSocket to close.
+        """
+        try:
+            ws.send_close() # websocket-client uses send_close() then close()
+            ws.close()
+        except Exception as e:
+            log.warning(f"Error closing WebSocket: {e}")
+
     def get_repo(self, name):
         """Get a specific repo by name.
 
@@ -129,31 +256,117 @@ class Client(object):
         """
         return self.repositories.get(name)
 
+    @staticmethod
+    def __drain_pending(ws):
+        """Non-blockingly pull any frames already queued on the WebSocket.
+
+        Used by __run to batch bursts of events so the Python-level dispatch
+        overhead is amortized across the whole burst.
+
+        :param ws: WebSocket to drain.
+        :return: List of raw frame payloads; ends with None if the socket
+                 closed.
+        """
+        pending = []
+        sock = getattr(ws, 'sock', None)
+        if sock is None:
+            return pending
+        # noinspection PyBroadException
+        try:
+            # Restore the socket's original timeout afterwards rather than
+            # setblocking(True): that would be settimeout(None) and would
+            # erase any timeout run() configured, leaving the blocking
+            # recv_data to hang forever on a dead connection.
+            prev_timeout = sock.gettimeout()
+            sock.setblocking(False)
+            try:
+                while select.select([sock], [], [], 0)[0]:
+                    opcode, data = ws.recv_data(control_frame=False)
+                    if data is None or opcode == _OPCODE_CLOSE:
+                        pending.append(None)
+                        break
+                    if opcode == _OPCODE_TEXT or opcode == _OPCODE_BINARY:
+                        pending.append(data)
+            finally:
+                sock.settimeout(prev_timeout)
+        except Exception:
+            # Draining is best-effort; fall back to the blocking recv loop.
+            pass
+        return pending
+
     def __run(self, ws):
         """Drains all messages from a WebSocket, sending them to the client's
         listeners.
 
+        Blocks for the first frame, then opportunistically drains any frames
+        that are already available, so event bursts are parsed and dispatched
+        as a batch.
+
         :param ws: WebSocket to drain.
         """
-        # TypeChecker false positive on iter(callable, sentinel) -> iterator
-        # Fixed in plugin v3.0.1
-        # noinspection PyTypeChecker
-        for msg_str in iter(lambda: ws.recv(), None):
-            msg_json = json.loads(msg_str)
-            if not isinstance(msg_json, dict) or 'type' not in msg_json:
-                log.error("Invalid event: %s" % msg_str)
+        # Bind everything the per-message loop needs to locals once per
+        # connection; LOAD_FAST is materially cheaper than LOAD_ATTR and this
+        # loop runs for every inbound event.
+        loads = _json_loads
+        listeners_map = self.event_listeners
+        exception_handler = self.exception_handler
+        drain_pending = self.__drain_pending
+        recv_data = ws.recv_data
+
+        while True:
+            # recv_data() hands back the raw frame payload as bytes, which
+            # orjson parses directly without the UTF-8 decode recv() does.
+            opcode, data = recv_data(control_frame=False)
+            if data is None or opcode == _OPCODE_CLOSE:
+                break
+            if opcode != _OPCODE_TEXT and opcode != _OPCODE_BINARY:
+                continue
+
+            batch = [data]
+            batch.extend(drain_pending(ws))
+            closed = batch[-1] is None
+            if closed:
+                batch.pop()
+
+            # No one is listening (e.g. during startup before any on_event):
+            # keep draining, but skip the parse/partition work entirely.
+            if not listeners_map:
+                if closed:
+                    break
                 continue
 
-            listeners = list(self.event_listeners.get(msg_json['type'], []))
-            for listener in listeners:
-                # noinspection PyBroadException
+            # Partition the batch by event type so each type's listener
+            # snapshot is resolved once per batch instead of once per event.
+            events_by_type = {}
+            for data in batch:
+                msg_json = loads(data)
+                # EAFP: a valid ARI frame is always a JSON object carrying
+                # 'type', so subscript directly instead of isinstance plus
+                # membership test on the happy path.
                 try:
-                    callback, args, kwargs = listener
-                    args = args or ()
-                    kwargs = kwargs or {}
-                    callback(msg_json, *args, **kwargs)
-                except Exception as e:
-                    self.exception_handler(e)
+                    event_type = msg_json['type']
+                except (TypeError, KeyError):
+                    # ARI events can be multi-KB; only format the payload
+                    # into the message if the record will actually be logged.
+                    if log.isEnabledFor(logging.ERROR):
+                        log.error("Invalid event: %s", data)
+                    continue
+                events_by_type.setdefault(event_type, []).append(msg_json)
+
+            for event_type, events in events_by_type.items():
+                listeners = listeners_map.get(event_type, _EMPTY)[1]
+                if not listeners:
+                    continue
+                for msg_json in events:
+                    for dispatch in listeners:
+                        # noinspection PyBroadException
+                        try:
+                            dispatch(msg_json)
+                        except Exception as e:
+                            exception_handler(e)
+
+            if closed:
+                break
 
     def run(self, apps):
         """Connect to the WebSocket and begin processing messages.
@@ -167,33 +380,9 @@ class Client(object):
         if isinstance(apps, list):
             apps = ','.join(apps)
 
-        # Construct WebSocket URL
-        # Base URL for WebSocket needs to be derived from `base_url`
-        parsed_b_url = urlparse(base_url) # base_url from Client.__init__
-        ws_scheme = 'wss' if parsed_b_url.scheme == 'https' else 'ws'
-        # Assuming ARI events are typically at <base_ari_path>/events/eventWebsocket
-        # If base_url = "http://localhost:8088/ari", then ws_url = "ws://localhost:8088/ari/events/eventWebsocket"
-
-        # The path for eventWebsocket operation.
-        # In swaggerpy, self.swagger.events.eventWebsocket directly made the call.
-        # We need to find this path from the spec or assume it.
-        # Common practice for ARI is "/ari/events/eventWebsocket" if base_url points to http://host:port
-        # or "/events/eventWebsocket" if base_url already includes /ari, like http://host:port/ari
-
-        # Let's try to build from base_url and a known relative path for events.
-        # If base_url is "http://localhost:8088/prefix" and ARI is at "/ari" under that,
-        # and events are at "/ari/events/eventWebsocket"
-        # A common way swagger tools resolve this is by having the full path in the spec.
-        # For bravado-core, an operation object would have `op.path_name`.
-        # `self.swagger_client.events.eventWebsocket` should be the operation.
-
-        websocket_path_segment = "/events/eventWebsocket" # Relative to ARI's application root
-
-        # Ensure base_url ends with a slash for proper joining if it's just host or host/path_prefix
-        effective_base_url = parsed_b_url.path.rstrip('/')
-
-        ws_url_path = effective_base_url + websocket_path_segment
-        ws_full_url = f"{ws_scheme}://{parsed_b_url.netloc}{ws_url_path}?app={apps}"
+        # The URL template was derived from base_url in __init__; only the
+        # app list varies per connection.
+        ws_full_url = self._ws_url_template.format(apps=apps)
 
         # TODO: Add api_key if required by ARI for WebSockets.
         # Example: ws_full_url += "&api_key=your_api_key"
@@ -203,7 +392,7 @@ class Client(object):
         log.info(f"Connecting to WebSocket: {ws_full_url}")
         ws = websocket.create_connection(ws_full_url)
 
-        self.websockets.add(ws)
+        self.websockets.append(ws)
         try:
             self.__run(ws)
         finally:
@@ -211,8 +400,10 @@ class Client(object):
                 ws.close()
             except Exception as e:
                 log.warning(f"Error during WebSocket close in finally block: {e}")
-            if ws in self.websockets:
+            try:
                 self.websockets.remove(ws)
+            except ValueError:
+                pass
 
     def on_event(self, event_type, event_cb, *args, **kwargs):
         """Register callback for events with given type.
@@ -223,12 +414,27 @@ class Client(object):
         :param args: Arguments to pass to event_cb
         :param kwargs: Keyword arguments to pass to event_cb
         """
-        listeners = self.event_listeners.setdefault(event_type, list())
-        for cb in listeners:
-            if event_cb == cb[0]:
-                listeners.remove(cb)
+        registrations = self.event_listeners[event_type][0]
         callback_obj = (event_cb, args, kwargs)
-        listeners.append(callback_obj)
+        if args or kwargs:
+            # Pre-bind the extra arguments so dispatch is a plain call.
+            def dispatch(event, _cb=event_cb, _args=args, _kwargs=kwargs):
+                _cb(event, *_args, **_kwargs)
+        else:
+            dispatch = event_cb
+        # Keyed by the callback itself so re-registering the same callback
+        # is an O(1) replace instead of a linear scan; bound methods hash
+        # and compare equal across attribute accesses, which id() would
+        # not. Pop first so a replaced registration moves to the end,
+        # matching the old list semantics.
+        key = event_cb
+        entry = (callback_obj, dispatch)
+        registrations.pop(key, None)
+        registrations[key] = entry
+        # The dispatcher in __run iterates the immutable tuple snapshot, so
+        # it never has to copy the mutable registrations on the hot path.
+        self.event_listeners[event_type] = \
+            (registrations, tuple(e[1] for e in registrations.values()))
         client = self
 
         class EventUnsubscriber(object):
@@ -238,8 +444,13 @@ class Client(object):
             def close(self):
                 """Unsubscribe the associated event callback.
                 """
-                if callback_obj in client.event_listeners[event_type]:
-                    client.event_listeners[event_type].remove(callback_obj)
+                registrations = \
+                    client.event_listeners.get(event_type, _EMPTY)[0]
+                if registrations.get(key) is entry:
+                    del registrations[key]
+                    client.event_listeners[event_type] = \
+                        (registrations,
+                         tuple(e[1] for e in registrations.values()))
 
         return EventUnsubscriber()
 
@@ -259,39 +470,56 @@ class Client(object):
         :param args: Arguments to pass to event_cb
         :param kwargs: Keyword arguments to pass to event_cb
         """
-        # Find the associated model from the Swagger declaration (now bravado_core based)
-        event_model_spec = self.event_models.get(event_type) # This now gets the raw spec_dict for the model
-        if not event_model_spec:
-            raise ValueError("Cannot find event model '%s'" % event_type)
-
-        # Extract the fields that are of the expected type
-        # The structure of event_model_spec (from bravado_core.spec.Spec.definitions[...].spec_dict)
-        # should be similar to the old event_model structure.
-        obj_fields = [k for (k, v) in event_model_spec.get('properties', {}).items()
-                      if v.get('type') == model_id or (v.get('$ref') and v.get('$ref').endswith(f'/{model_id}'))]
+        key = (event_type, model_id)
+        obj_fields = self._obj_fields_cache.get(key)
+        if obj_fields is None:
+            # Cache miss: model id not in the precomputed set, or unknown
+            # event type. Fall back to walking the model spec once.
+            event_model_spec = self.event_models.get(event_type)
+            if not event_model_spec:
+                raise ValueError("Cannot find event model '%s'" % event_type)
+            obj_fields = self._build_obj_fields(event_model_spec, model_id)
+            self._obj_fields_cache[key] = obj_fields
         if not obj_fields:
             raise ValueError("Event model '%s' has no fields of type %s"
                              % (event_type, model_id))
 
-        def extract_objects(event, *args, **kwargs):
-            """Extract objects of a given type from an event.
-
-            :param event: Event
-            :param args: Arguments to pass to the event callback
-            :param kwargs: Keyword arguments to pass to the event
-                                      callback
-            """
-            # Extract the fields which are of the expected type
-            obj = {obj_field: factory_fn(self, event[obj_field])
-                   for obj_field in obj_fields
-                   if event.get(obj_field)}
-            # If there's only one field in the schema, just pass that along
-            if len(obj_fields) == 1 and obj: # Ensure obj is not empty
-                # obj is a dict, get its first value
-                obj = next(iter(obj.values()))
-            elif not obj: # If obj is empty (no matching fields found in the event instance)
-                 obj = None
-            event_cb(obj, event, *args, **kwargs)
+        if len(obj_fields) == 1:
+            # Single candidate field (the common shape for Channel/Bridge
+            # events): skip the dict build and pass the object along directly.
+            obj_field = obj_fields[0]
+
+            # The captured state is bound as default arguments so the hot
+            # path reads locals (LOAD_FAST) instead of closure cells.
+            def extract_objects(event, *args, _client=self,
+                                _factory=factory_fn, _field=obj_field,
+                                _cb=event_cb, **kwargs):
+                """Extract the object of a given type from an event.
+
+                :param event: Event
+                :param args: Arguments to pass to the event callback
+                :param kwargs: Keyword arguments to pass to the event
+                                          callback
+                """
+                obj_json = event.get(_field)
+                obj = _factory(_client, obj_json) if obj_json else None
+                _cb(obj, event, *args, **kwargs)
+        else:
+            def extract_objects(event, *args, _client=self,
+                                _factory=factory_fn, _fields=obj_fields,
+                                _cb=event_cb, **kwargs):
+                """Extract objects of a given type from an event.
+
+                :param event: Event
+                :param args: Arguments to pass to the event callback
+                :param kwargs: Keyword arguments to pass to the event
+                                          callback
+                """
+                # Extract the fields which are of the expected type
+                obj = {obj_field: _factory(_client, event[obj_field])
+                       for obj_field in _fields
+                       if event.get(obj_field)}
+                _cb(obj or None, event, *args, **kwargs)
 
         return self.on_event(event_type, extract_objects,
                              *args,
@@ -17,13 +17,140 @@ The first-class objects also have 'on_event' methods, which can subscribe to
 Stasis events relating to that object.
 """
 
+import asyncio
+import functools
 import re
+import sys
 # import requests # Keep for requests.codes if needed, or remove if bravado provides alternatives
 import logging
 from bravado_core.exception import HTTPError # For type hinting if needed, bravado raises by default
 
 log = logging.getLogger(__name__)
 
+#: Attribute prefix that exposes an awaitable variant of any operation, e.g.
+#: ``await channel.async_hangup()`` or ``await client.channels.async_list()``.
+ASYNC_OP_PREFIX = 'async_'
+
+#: Attribute suffix that exposes a streaming variant of a list operation,
+#: e.g. ``for endpoint in client.endpoints.list_iter(): ...``.
+ITER_OP_SUFFIX = '_iter'
+
+
+def _make_async(sync_callable):
+    """Wrap a synchronous operation callable into a coroutine function.
+
+    The blocking bravado call is offloaded to the running event loop's
+    default executor, so multiple ARI operations can be awaited concurrently
+    (e.g. ``await asyncio.gather(*(ch.async_hangup() for ch in channels))``)
+    and complete in roughly one round trip instead of one per call.
+
+    :param sync_callable: Synchronous operation callable to wrap.
+    :return: Coroutine function with the same keyword interface.
+    """
+    async def async_callable(**kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(sync_callable, **kwargs))
+    return async_callable
+
+
+class _BoundOp(object):
+    """Operation callable bound to a client and operation spec.
+
+    Replaces the closure-per-bind pattern: captured state lives in fixed
+    slots instead of cell objects, so calls load attributes at fixed
+    offsets and the instance costs less than a function + cells.
+
+    :param client: ARI client.
+    :param op: Underlying bravado operation callable.
+    :param spec: bravado_core operation specification object.
+    """
+
+    __slots__ = ('client', 'op', 'spec', 'plan')
+
+    def __init__(self, client, op, spec):
+        self.client = client
+        self.op = op
+        self.spec = spec
+        # The promotion plan is derived from the spec once at bind time;
+        # the bound op holds a strong reference to its spec, so the plan
+        # can never outlive the spec it was built from.
+        self.plan = _build_plan(spec)
+
+    def __call__(self, **kwargs):
+        return _promote_response(self.client, self.op(**kwargs).result(),
+                                 self.plan)
+
+
+class _BoundIterOp(_BoundOp):
+    """Streaming variant: promotes list responses lazily via promote_iter.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, **kwargs):
+        return _promote_response_iter(self.client,
+                                      self.op(**kwargs).result(), self.plan)
+
+
+class _BoundNoBodyOp(_BoundOp):
+    """Fast path for 204-only operations: nothing to promote.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, **kwargs):
+        # .result() still raises on errors.
+        self.op(**kwargs).result()
+        return None
+
+
+class _BoundEnrichOp(_BoundOp):
+    """Instance-scoped operation: injects the object's id params per call.
+
+    :param id_params: Identity parameters (e.g. channelId) merged into
+                      every call's kwargs.
+    """
+
+    __slots__ = ('id_params',)
+
+    def __init__(self, client, op, spec, id_params):
+        super(_BoundEnrichOp, self).__init__(client, op, spec)
+        self.id_params = id_params
+
+    def __call__(self, **kwargs):
+        kwargs.update(self.id_params)
+        return _promote_response(self.client, self.op(**kwargs).result(),
+                                 self.plan)
+
+
+class _BoundEnrichNoBodyOp(_BoundEnrichOp):
+    """Instance-scoped fast path for 204-only operations.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, **kwargs):
+        kwargs.update(self.id_params)
+        self.op(**kwargs).result()
+        return None
+
+
+def _returns_no_body(operation_spec):
+    """Check whether an operation is declared to never return a body.
+
+    Many ARI operations (hangup, playback stop, recording cancel, ...)
+    declare only a 204 No Content response; for those the whole promote
+    schema walk is dead work and the bound callable can return None
+    directly.
+
+    :param operation_spec: bravado_core operation specification object.
+    :return: True if no declared response carries a schema.
+    """
+    responses = operation_spec.spec_dict.get('responses') or {}
+    return not any(response_spec.get('schema')
+                   for response_spec in responses.values())
+
 
 class Repository(object):
     """ARI repository.
@@ -41,43 +168,91 @@ class Repository(object):
     """
 
     def __init__(self, client, name, resource):
+        # Cache of resolved operation callables; set first so __getattr__
+        # can always rely on it.
+        self._op_cache = {}
         self.client = client
         self.name = name
         self.bravado_resource = resource # Renamed from self.api to be clear
+        # Eagerly publish the resource's operations as plain instance
+        # attributes, so calls go through normal attribute lookup (which
+        # CPython 3.11+ specializes) instead of the __getattr__ slow path.
+        for op_name in getattr(resource, 'operations', None) or ():
+            try:
+                self.__dict__[op_name] = self._bind_operation(op_name)
+            except AttributeError:
+                # Not a regular promotable operation; leave it to the lazy
+                # __getattr__ path (which will re-raise for true misses).
+                continue
 
     def __repr__(self):
         return "Repository(%s)" % self.name
 
-    def __getattr__(self, item):
-        """Maps resource operations to methods on this object.
+    def _bind_operation(self, item, streaming=False):
+        """Resolve a bravado operation and build its promoting callable.
 
         :param item: Item name (operationId or nickname).
+        :param streaming: If True, build a callable returning a generator of
+                          promoted objects (see promote_iter) instead of a
+                          fully materialized result.
+        :return: Callable executing the operation and promoting the result.
+        :raises AttributeError: If the resource has no such operation.
         """
-        # getattr on a bravado_core.resource.Resource gives you the operation method
-        bravado_operation_callable = getattr(self.bravado_resource, item, None)
+        # One EAFP walk resolves the operation method and its spec (a bravado
+        # operation method carries an Operation at .operation, which holds
+        # the spec at .op_spec). Each hasattr is a hidden try/getattr, so a
+        # single try here does in three attribute gets what the old
+        # getattr-with-default plus two hasattr checks did in about seven.
+        try:
+            bravado_operation_callable = getattr(self.bravado_resource, item)
+            operation_spec = bravado_operation_callable.operation.op_spec
+        except AttributeError:
+            raise AttributeError(
+                "'%r' object has no operation '%s'" % (self, item)) from None
         if not callable(bravado_operation_callable):
             raise AttributeError(
-                "'%r' object has no attribute '%s' or it's not callable" % (self, item))
-
-        # Access the operation spec from the callable (e.g., bravado_operation_callable.operation.op_spec)
-        # This structure depends on bravado-core's internals for how it attaches spec to operation callables.
-        # Typically, a bravado operation method has an 'operation' attribute which is an Operation object,
-        # and that Operation object has an 'op_spec' attribute.
-        if not hasattr(bravado_operation_callable, 'operation') or \
-           not hasattr(bravado_operation_callable.operation, 'op_spec'):
+                "'%r' attribute '%s' is not callable" % (self, item))
+
+        if streaming:
+            return _BoundIterOp(self.client, bravado_operation_callable,
+                                operation_spec)
+        if _returns_no_body(operation_spec):
+            return _BoundNoBodyOp(self.client, bravado_operation_callable,
+                                  operation_spec)
+        return _BoundOp(self.client, bravado_operation_callable,
+                        operation_spec)
+
+    def __getattr__(self, item):
+        """Maps resource operations to methods on this object.
+
+        Operations known at construction time are bound eagerly in __init__;
+        this is the miss path for anything resolved lazily. Prefixing an
+        operation name with ``async_`` returns an awaitable variant that
+        runs the blocking call in the event loop's executor; suffixing a
+        list operation with ``_iter`` returns a variant yielding promoted
+        objects one at a time instead of materializing the whole list.
+
+        :param item: Item name (operationId or nickname).
+        """
+        if item.startswith(ASYNC_OP_PREFIX):
+            return _make_async(getattr(self, item[len(ASYNC_OP_PREFIX):]))
+        if item.startswith('_'):
+            # Operation nicknames never start with an underscore; bail out
+            # early so internal attribute probes don't walk the resource.
             raise AttributeError(
-                "Operation '%s' does not have expected spec structure" % item)
-
-        operation_spec = bravado_operation_callable.operation.op_spec
-
-        def new_callable(**kwargs):
-            # Execute the bravado operation
-            # .result() will raise an HTTPError for non-2XX responses by default
-            http_future = bravado_operation_callable(**kwargs)
-            bravado_response = http_future.result() # This is bravado_core.response.IncomingResponse
-                                                 # or the deserialized object directly if configured.
-                                                 # Assuming it's IncomingResponse which has .result for body.
-            return promote(self.client, bravado_response, operation_spec)
+                "'%r' object has no attribute '%s'" % (self, item))
+        cached = self._op_cache.get(item)
+        if cached is not None:
+            return cached
+        if item.endswith(ITER_OP_SUFFIX) and len(item) > len(ITER_OP_SUFFIX):
+            new_callable = self._bind_operation(
+                item[:-len(ITER_OP_SUFFIX)], streaming=True)
+        else:
+            new_callable = self._bind_operation(item)
+        self._op_cache[item] = new_callable
+        # Publish on the instance as well, so subsequent accesses resolve
+        # through the normal attribute lookup and skip __getattr__ entirely.
+        self.__dict__[item] = new_callable
         return new_callable
 
 
@@ -86,6 +261,8 @@ class ObjectIdGenerator(object):
     representation.
     """
 
+    __slots__ = ()
+
     def get_params(self, obj_json):
         """Gets the paramater values for specifying this object in a query.
 
@@ -115,6 +292,8 @@ class DefaultObjectIdGenerator(ObjectIdGenerator):
     :param id_field:    Name of the field to specify in JSON.
     """
 
+    __slots__ = ('param_name', 'id_field')
+
     def __init__(self, param_name, id_field='id'):
         self.param_name = param_name
         self.id_field = id_field
@@ -126,6 +305,88 @@ class DefaultObjectIdGenerator(ObjectIdGenerator):
         return obj_json[self.id_field]
 
 
+def _dispatch_object_event_single(obj, event, index):
+    """Dispatch an object-scoped event whose extractor yields one object.
+
+    :param obj: Object extracted from the event (or None).
+    :param event: Event.
+    :param index: Mapping of object id to listener entries.
+    """
+    if obj is None:
+        return
+    entries = index.get(obj.id)
+    if entries:
+        # Iterate a snapshot so callbacks may unsubscribe mid-event.
+        for fn, args, kwargs in tuple(entries):
+            fn(obj, event, *args, **kwargs)
+
+
+def _dispatch_object_event_dict(objects, event, index):
+    """Dispatch an object-scoped event whose extractor yields a field dict.
+
+    :param objects: Mapping of field name to extracted object (or None).
+    :param event: Event.
+    :param index: Mapping of object id to listener entries.
+    """
+    if objects is None:
+        return
+    for obj in objects.values():
+        entries = index.get(obj.id)
+        if entries:
+            for fn, args, kwargs in tuple(entries):
+                fn(objects, event, *args, **kwargs)
+
+
+def _dispatch_object_event(objects, event, index):
+    """Dispatch an object-scoped event of unknown shape.
+
+    Fallback for event types whose extractor shape could not be determined
+    at registration time; the specialized single/dict dispatchers above
+    skip the per-event isinstance.
+
+    :param objects: Object (or dict of objects) extracted from the event.
+    :param event: Event.
+    :param index: Mapping of object id to listener entries.
+    """
+    if isinstance(objects, dict):
+        for obj in objects.values():
+            entries = index.get(obj.id)
+            if entries:
+                # Iterate a snapshot so callbacks may unsubscribe mid-event.
+                for fn, args, kwargs in tuple(entries):
+                    fn(objects, event, *args, **kwargs)
+    elif objects is not None:
+        entries = index.get(objects.id)
+        if entries:
+            for fn, args, kwargs in tuple(entries):
+                fn(objects, event, *args, **kwargs)
+
+
+class _ObjectEventUnsubscriber(object):
+    """Allows object-scoped event callbacks to be unsubscribed.
+
+    :param index: Id-indexed listener map the entry was registered in.
+    :param obj_id: Id of the object the callback was registered for.
+    :param entry: Listener entry to remove on close.
+    """
+
+    __slots__ = ('index', 'obj_id', 'entry')
+
+    def __init__(self, index, obj_id, entry):
+        self.index = index
+        self.obj_id = obj_id
+        self.entry = entry
+
+    def close(self):
+        """Unsubscribe the associated event callback.
+        """
+        entries = self.index.get(self.obj_id)
+        if entries and self.entry in entries:
+            entries.remove(self.entry)
+            if not entries:
+                del self.index[self.obj_id]
+
+
 class BaseObject(object):
     """Base class for ARI domain objects.
 
@@ -138,13 +399,28 @@ class BaseObject(object):
     :param event_reg: Event registration callback.
     """
 
+    # Fixed-offset slots: ARI objects are created per response/event, so a
+    # per-instance __dict__ for five fields is wasted memory and slower
+    # attribute access on a busy PBX.
+    __slots__ = ('client', 'bravado_resource', 'json', 'id', 'event_reg',
+                 '_op_cache', '_id_params', '__weakref__')
+
     id_generator = ObjectIdGenerator()
 
     def __init__(self, client, bravado_resource, as_json, event_reg):
+        # Cache of resolved operation callables; set first so __getattr__
+        # can always rely on it.
+        self._op_cache = {}
         self.client = client
         self.bravado_resource = bravado_resource # Renamed from self.api
         self.json = as_json
-        self.id = self.id_generator.id_as_str(as_json)
+        # Ids are short strings compared on every dispatch through the
+        # object-listener index; interning lets those comparisons (and the
+        # dict probes) short-circuit on pointer identity.
+        self.id = sys.intern(self.id_generator.id_as_str(as_json))
+        # The id params depend only on identity fields, so compute them once
+        # instead of on every operation call.
+        self._id_params = self.id_generator.get_params(as_json)
         self.event_reg = event_reg
 
     def __repr__(self):
@@ -154,35 +430,44 @@ class BaseObject(object):
         """Promote resource operations related to a single resource to methods
         on this class.
 
+        Prefixing an operation name with ``async_`` returns an awaitable
+        variant that runs the blocking call in the event loop's executor.
+
         :param item: Item name (operationId or nickname).
         """
-        bravado_operation_callable = getattr(self.bravado_resource, item, None)
-        if not callable(bravado_operation_callable):
+        if item.startswith(ASYNC_OP_PREFIX):
+            return _make_async(getattr(self, item[len(ASYNC_OP_PREFIX):]))
+        if item.startswith('_'):
+            # Operation nicknames never start with an underscore; bail out
+            # early so internal attribute probes don't walk the resource.
             raise AttributeError(
-                "'%r' object has no attribute '%r' or it's not callable" % (self, item))
-
-        if not hasattr(bravado_operation_callable, 'operation') or \
-           not hasattr(bravado_operation_callable.operation, 'op_spec'):
+                "'%r' object has no attribute '%s'" % (self, item))
+        cached = self._op_cache.get(item)
+        if cached is not None:
+            return cached
+        # Single EAFP walk for the operation method and its spec; see
+        # Repository._bind_operation for rationale.
+        try:
+            bravado_operation_callable = getattr(self.bravado_resource, item)
+            operation_spec = bravado_operation_callable.operation.op_spec
+        except AttributeError:
             raise AttributeError(
-                "Operation '%s' does not have expected spec structure" % item)
-
-        operation_spec = bravado_operation_callable.operation.op_spec
-
-        def enrich_operation(**kwargs):
-            """Enriches an operation by specifying parameters specifying this
-            object's id (i.e., channelId=self.id), and promotes HTTP response
-            to a first-class object.
-
-            :param kwargs: Operation parameters
-            :return: First class object mapped from HTTP response.
-            """
-            # Add id to param list
-            kwargs.update(self.id_generator.get_params(self.json))
-            http_future = bravado_operation_callable(**kwargs)
-            bravado_response = http_future.result()
-            return promote(self.client, bravado_response, operation_spec)
+                "'%r' object has no operation '%s'" % (self, item)) from None
+        if not callable(bravado_operation_callable):
+            raise AttributeError(
+                "'%r' attribute '%s' is not callable" % (self, item))
 
-        return enrich_operation
+        if _returns_no_body(operation_spec):
+            # 204-only operation (hangup, stop, cancel, ...).
+            bound = _BoundEnrichNoBodyOp(
+                self.client, bravado_operation_callable, operation_spec,
+                self._id_params)
+        else:
+            bound = _BoundEnrichOp(
+                self.client, bravado_operation_callable, operation_spec,
+                self._id_params)
+        self._op_cache[item] = bound
+        return bound
 
     def on_event(self, event_type, fn, *args, **kwargs):
         """Register event callbacks for this specific domain object.
@@ -195,24 +480,38 @@ class BaseObject(object):
         :param kwargs: Keyword arguments to pass to fn
         """
 
-        def fn_filter(objects, event, *args, **kwargs):
-            """Filter received events for this object.
-
-            :param objects: Objects found in this event.
-            :param event: Event.
-            """
-            if isinstance(objects, dict):
-                if self.id in [c.id for c in objects.values()]:
-                    fn(objects, event, *args, **kwargs)
-            else:
-                if self.id == objects.id:
-                    fn(objects, event, *args, **kwargs)
-
         if not self.event_reg:
             msg = "Event callback registration called on object with no events"
             raise RuntimeError(msg)
 
-        return self.event_reg(event_type, fn_filter, *args, **kwargs)
+        # Keyed per model class as well as event type: event_reg runs a
+        # class-specific extractor (Channel and Bridge registrations for
+        # the same event type each need their own), so each class gets its
+        # own index and dispatcher registration.
+        index_key = (event_type, type(self))
+        index = self.client._object_listeners.get(index_key)
+        if index is None:
+            index = {}
+            self.client._object_listeners[index_key] = index
+            # A single shared dispatcher per event type consults the id
+            # index, so dispatch cost scales with the callbacks actually
+            # interested in this event's objects instead of invoking one
+            # filter closure per registered object. Whether the extractor
+            # yields a single object or a field dict is fixed per event
+            # type by the spec, so pick the specialized dispatcher here
+            # rather than testing isinstance on every event.
+            fields = self.client._obj_fields_cache.get(
+                (event_type, type(self).__name__))
+            if fields is None:
+                dispatcher = _dispatch_object_event
+            elif len(fields) > 1:
+                dispatcher = _dispatch_object_event_dict
+            else:
+                dispatcher = _dispatch_object_event_single
+            self.event_reg(event_type, dispatcher, index)
+        entry = (fn, args, kwargs)
+        index.setdefault(self.id, []).append(entry)
+        return _ObjectEventUnsubscriber(index, self.id, entry)
 
 
 class Channel(BaseObject):
@@ -223,6 +522,7 @@ class Channel(BaseObject):
     :param channel_json: Instance data
     """
 
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('channelId')
 
     def __init__(self, client, channel_json):
@@ -239,6 +539,7 @@ class Bridge(BaseObject):
     :param bridge_json: Instance data
     """
 
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('bridgeId')
 
     def __init__(self, client, bridge_json):
@@ -254,6 +555,7 @@ class Playback(BaseObject):
     :type  client:  client.Client
     :param playback_json: Instance data
     """
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('playbackId')
 
     def __init__(self, client, playback_json):
@@ -269,6 +571,7 @@ class LiveRecording(BaseObject):
     :type  client: client.Client
     :param recording_json: Instance data
     """
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('recordingName', id_field='name')
 
     def __init__(self, client, recording_json):
@@ -284,6 +587,7 @@ class StoredRecording(BaseObject):
     :type  client: client.Client
     :param recording_json: Instance data
     """
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('recordingName', id_field='name')
 
     def __init__(self, client, recording_json):
@@ -297,6 +601,8 @@ class EndpointIdGenerator(ObjectIdGenerator):
     """Id generator for endpoints, because they are weird.
     """
 
+    __slots__ = ()
+
     def get_params(self, obj_json):
         return {
             'tech': obj_json['technology'],
@@ -304,7 +610,9 @@ class EndpointIdGenerator(ObjectIdGenerator):
         }
 
     def id_as_str(self, obj_json):
-        return "%(tech)s/%(resource)s" % self.get_params(obj_json)
+        # Read the fields directly rather than paying for get_params' dict
+        # plus %(name)s formatting on every Endpoint construction.
+        return f"{obj_json['technology']}/{obj_json['resource']}"
 
 
 class Endpoint(BaseObject):
@@ -314,6 +622,7 @@ class Endpoint(BaseObject):
     :type  client:  client.Client
     :param endpoint_json: Instance data
     """
+    __slots__ = ()
     id_generator = EndpointIdGenerator()
 
     def __init__(self, client, endpoint_json):
@@ -329,6 +638,7 @@ class DeviceState(BaseObject):
     :type  client:  client.Client
     :param endpoint_json: Instance data
     """
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('deviceName', id_field='name')
 
     def __init__(self, client, device_state_json):
@@ -345,6 +655,7 @@ class Sound(BaseObject):
     :param sound_json: Instance data
     """
 
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('soundId')
 
     def __init__(self, client, sound_json):
@@ -360,6 +671,7 @@ class Mailbox(BaseObject):
     :param mailbox_json: Instance data
     """
 
+    __slots__ = ()
     id_generator = DefaultObjectIdGenerator('mailboxName', id_field='name')
 
     def __init__(self, client, mailbox_json):
@@ -367,117 +679,204 @@ class Mailbox(BaseObject):
             client, client.swagger_client.mailboxes, mailbox_json, None) # Use swagger_client
 
 
-def promote(client, bravado_response, operation_spec):
-    """Promote a response from bravado_core to a first-class ARI object.
-
-    :param client: ARI client.
-    :type  client: ari.client.Client
-    :param bravado_response: The response object from a bravado_core operation call.
-                             This is typically bravado_core.response.IncomingResponse,
-                             or can be the direct deserialized result if configured.
-    :type bravado_response: bravado_core.response.IncomingResponse or dict/list/etc.
-    :param operation_spec: bravado_core operation specification object.
-    :type  operation_spec: bravado_core.spec.OpSpec
-    :return: Promoted object or list of objects, or raw JSON data.
-    """
-    # bravado-core raises HTTPError for non-2XX by default when .result() is called on the future.
-    # So, no need for bravado_response.raise_for_status() if we got here via .result().
-    # If bravado_response is the direct result, then status code check is relevant for 204.
-
-    status_code = None
-    response_data = None
+# Plans are plain (factory, is_list, class_name) tuples — the closest
+# pure-Python analog of a C struct: unpacking is a single C-level fetch per
+# field with no descriptor lookups on the response hot path. Each bound
+# operation builds its plan once at bind time and carries it alongside the
+# spec it was derived from.
 
-    if hasattr(bravado_response, 'status_code') and hasattr(bravado_response, 'result'):
-        # It's likely an IncomingResponse wrapper
-        status_code = bravado_response.status_code
-        response_data = bravado_response.result # Deserialized body
-    else:
-        # It might be the direct deserialized result (e.g., for a 200 OK with body)
-        # or None (e.g., for a 204 No Content if bravado is configured to return None directly)
-        response_data = bravado_response
-        # We need a status code if we are to check for 204.
-        # This path is problematic if we need to distinguish 204 from an empty 200 response.
-        # For now, assume if it's not an IncomingResponse, it's a successful result or None for 204.
-        if response_data is None: # Potentially a 204
-             # We can't be sure it was 204 without the status_code from IncomingResponse.
-             # This logic might need to be revisited depending on bravado_core configuration.
-             # For now, if data is None, assume it's like a 204.
-             pass
 
+def _build_plan(operation_spec):
+    """Walk an operation spec's responses once and build its promotion plan.
 
-    # Determine the expected response type from the operation_spec
-    # Example: operation_spec.spec_dict['responses']['200']['schema']
-    # This can be complex due to $ref, type, items, etc.
+    Success schemas are resolved in ('200', '201', 'default') preference
+    order; ARI operations declare a single success schema, so this matches
+    what bravado used for deserialization.
 
-    # Default to string for response_class_name if not found, to avoid errors.
+    :param operation_spec: bravado_core operation specification object.
+    :return: (factory, is_list, class_name) plan tuple for the operation.
+    """
+    responses = operation_spec.spec_dict.get('responses') or {}
+    success_schema = None
+    for key in ('200', '201', 'default'):
+        response_spec = responses.get(key)
+        if response_spec is not None:
+            success_schema = response_spec.get('schema')
+            if success_schema is not None:
+                break
+
+    # Default to a non-name so CLASS_MAP lookups miss cleanly.
     response_class_name = "Unknown"
     is_list = False
-
-    # Try to get schema for 200 or 201 response, typical success codes with bodies
-    # Bravado should have already used this to deserialize into response_data
-    success_schema = None
-    if str(status_code) in operation_spec.spec_dict.get('responses', {}):
-        success_schema = operation_spec.spec_dict['responses'][str(status_code)].get('schema')
-    elif '200' in operation_spec.spec_dict.get('responses', {}): # Fallback to 200
-        success_schema = operation_spec.spec_dict['responses']['200'].get('schema')
-    elif 'default' in operation_spec.spec_dict.get('responses', {}): # Fallback to default
-        success_schema = operation_spec.spec_dict['responses']['default'].get('schema')
-
-
     if success_schema:
-        if success_schema.get('type') == 'array' and '$ref' in success_schema.get('items', {}):
+        items = success_schema.get('items')
+        if success_schema.get('type') == 'array' and \
+                items and '$ref' in items:
             is_list = True
-            ref_path = success_schema['items']['$ref']
-            response_class_name = ref_path.split('/')[-1]  # Extract type name from $ref
+            # rpartition walks once from the right without allocating the
+            # intermediate component list split('/') would; interning the
+            # name makes the CLASS_MAP probe identity-fast.
+            response_class_name = sys.intern(
+                items['$ref'].rpartition('/')[2])
         elif '$ref' in success_schema:
-            is_list = False
-            ref_path = success_schema['$ref']
-            response_class_name = ref_path.split('/')[-1] # Extract type name from $ref
-        elif 'type' in success_schema: # Primitive type, not a model usually
+            response_class_name = sys.intern(
+                success_schema['$ref'].rpartition('/')[2])
+        elif 'type' in success_schema:
+            # Primitive (or array of primitives); not mapped to ARI objects.
             response_class_name = success_schema['type']
-            if response_class_name == 'array' and 'items' in success_schema and 'type' in success_schema['items']:
-                 # Array of primitives, not mapped to custom ARI objects
-                 pass # Keep response_data as is.
 
-    factory = CLASS_MAP.get(response_class_name)
+    return (_CLASS_MAP_GET(response_class_name), is_list,
+            response_class_name)
+
+
+def _promote_response(client, bravado_response, plan):
+    """Promote a response from bravado_core using a precomputed plan.
+
+    :param client: ARI client.
+    :type  client: ari.client.Client
+    :param bravado_response: The response object from a bravado_core
+                             operation call.
+    :param plan: (factory, is_list, class_name) plan from _build_plan.
+    :return: Promoted object or list of objects, or raw JSON data.
+    """
+    # bravado-core raises HTTPError for non-2XX by default when .result() is
+    # called on the future, so only success responses get this far.
+    if hasattr(bravado_response, 'status_code') and \
+            hasattr(bravado_response, 'result'):
+        # It's likely an IncomingResponse wrapper
+        status_code = bravado_response.status_code
+        response_data = bravado_response.result # Deserialized body
+    else:
+        # The direct deserialized result (e.g., for a 200 OK with body), or
+        # None (e.g., for a 204 if bravado is configured to return None).
+        status_code = None
+        response_data = bravado_response
 
-    # First, handle explicit 204 No Content if we have a status code
     if status_code == 204:
         return None
 
+    factory, is_list, class_name = plan
     if factory:
         if is_list:
             if isinstance(response_data, list):
-                # Filter out any None items if the list might contain them,
-                # though typically a list of objects shouldn't have None items unless spec allows.
-                return [factory(client, obj_json) for obj_json in response_data if obj_json is not None]
-            else:
-                log.warning(f"Expected a list for {response_class_name} but got {type(response_data)}")
-                # Depending on strictness, could raise error or return empty list/None
-                return None
-        else:
-            # If a factory is found for a single object, but response_data is None
-            # (and it wasn't a 204, e.g. empty 200 body for an optional object), return None.
-            if response_data is None:
-                return None
-            return factory(client, response_data) # response_data should be a dict here
+                # None items are rare; scan once at C speed and only pay
+                # the per-element filter when any are actually present.
+                if None in response_data:
+                    return [factory(client, obj_json)
+                            for obj_json in response_data
+                            if obj_json is not None]
+                return [factory(client, obj_json)
+                        for obj_json in response_data]
+            if log.isEnabledFor(logging.WARNING):
+                log.warning("Expected a list for %s but got %s",
+                            class_name, type(response_data))
+            return None
+        # If a factory is found for a single object, but response_data is
+        # None (e.g. empty 200 body for an optional object), return None.
+        if response_data is None:
+            return None
+        return factory(client, response_data) # response_data should be a dict
 
     # If no factory, but we have data, return the raw data.
     if response_data is not None:
-        log.info("No ARI class mapping for type '%s'; returning raw data: %s", response_class_name, str(response_data)[:100])
+        # str(response_data) can be huge for large listings; only pay for
+        # the stringify-and-truncate when INFO actually gets emitted.
+        if log.isEnabledFor(logging.INFO):
+            log.info("No ARI class mapping for type '%s'; "
+                     "returning raw data: %s",
+                     class_name, str(response_data)[:100])
         return response_data
 
-    # Default fallback (e.g. response_data was None, not a 204, and no factory matched)
+    # Default fallback (response_data was None and no factory matched).
     return None
 
 
-CLASS_MAP = {
-    'Bridge': Bridge,
-    'Channel': Channel,
-    'Endpoint': Endpoint,
-    'Playback': Playback,
-    'LiveRecording': LiveRecording,
-    'StoredRecording': StoredRecording,
-    'Mailbox': Mailbox,
-    'DeviceState': DeviceState,
-}
+def promote(client, bravado_response, operation_spec):
+    """Promote a response from bravado_core to a first-class ARI object.
+
+    Bound operations carry their plan and call _promote_response directly;
+    this entry point builds the plan per call for any remaining callers.
+
+    :param client: ARI client.
+    :type  client: ari.client.Client
+    :param bravado_response: The response object from a bravado_core operation call.
+                             This is typically bravado_core.response.IncomingResponse,
+                             or can be the direct deserialized result if configured.
+    :type bravado_response: bravado_core.response.IncomingResponse or dict/list/etc.
+    :param operation_spec: bravado_core operation specification object.
+    :type  operation_spec: bravado_core.spec.OpSpec
+    :return: Promoted object or list of objects, or raw JSON data.
+    """
+    return _promote_response(client, bravado_response,
+                             _build_plan(operation_spec))
+
+
+def _promote_response_iter(client, bravado_response, plan):
+    """Streaming variant of _promote_response for list operations.
+
+    Yields promoted objects one at a time instead of materializing the whole
+    list, so peak memory stays at one object (bravado already holds the JSON
+    list) and the first object is available after a single factory call
+    rather than after all N.
+
+    :param client: ARI client.
+    :type  client: ari.client.Client
+    :param bravado_response: The response object from a bravado_core
+                             operation call.
+    :param plan: (factory, is_list, class_name) plan from _build_plan.
+    :return: Iterator of promoted objects. Non-list responses yield the
+             single promoted result (or nothing, for empty responses).
+    """
+    if hasattr(bravado_response, 'status_code') and \
+            hasattr(bravado_response, 'result'):
+        status_code = bravado_response.status_code
+        response_data = bravado_response.result
+    else:
+        status_code = None
+        response_data = bravado_response
+
+    if status_code == 204 or response_data is None:
+        return iter(())
+
+    factory, is_list, _ = plan
+    if factory and is_list and isinstance(response_data, list):
+        return (factory(client, obj_json) for obj_json in response_data
+                if obj_json is not None)
+
+    # Non-list (or unmapped) operations promote as usual; yield at most one.
+    result = _promote_response(client, bravado_response, plan)
+    return iter(()) if result is None else iter((result,))
+
+
+def promote_iter(client, bravado_response, operation_spec):
+    """Streaming variant of promote for list operations.
+
+    :param client: ARI client.
+    :type  client: ari.client.Client
+    :param bravado_response: The response object from a bravado_core
+                             operation call.
+    :param operation_spec: bravado_core operation specification object.
+    :return: Iterator of promoted objects. Non-list responses yield the
+             single promoted result (or nothing, for empty responses).
+    """
+    return _promote_response_iter(client, bravado_response,
+                                  _build_plan(operation_spec))
+
+
+# Keys are interned explicitly: class names extracted from $ref paths at
+# runtime are looked up here many times, and interned keys let the dict
+# lookup (and any later equality check) short-circuit on pointer identity.
+CLASS_MAP = {sys.intern(name): cls for name, cls in (
+    ('Bridge', Bridge),
+    ('Channel', Channel),
+    ('Endpoint', Endpoint),
+    ('Playback', Playback),
+    ('LiveRecording', LiveRecording),
+    ('StoredRecording', StoredRecording),
+    ('Mailbox', Mailbox),
+    ('DeviceState', DeviceState),
+)}
+
+# Pre-bound lookup: LOAD_GLOBAL + CALL instead of
+# LOAD_GLOBAL + LOAD_ATTR + CALL everywhere a factory is resolved.
+_CLASS_MAP_GET = CLASS_MAP.get
